@@ -1,5 +1,28 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-# flake8: noqa: F401
 """glo: Grocery List Optimizer."""
-from . import data, features, models, helpers, reward, transform, units
+import importlib
+
+# subpackages are imported on first access, since some of them pull in
+# heavy dependencies such as torch that most users of glo don't need
+_SUBMODULES = (
+    "data",
+    "features",
+    "models",
+    "helpers",
+    "reward",
+    "transform",
+    "units",
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
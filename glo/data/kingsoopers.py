@@ -149,8 +149,15 @@ class ScrapyKingSoopersDataSet(PandasDataset):
         )
 
         super().__init__(
+            # every column is cast to object below, so skip dtype and
+            # date inference while reading
             pd.read_json(
-                self.file_path, orient="columns", typ="frame", lines=True
+                self.file_path,
+                orient="columns",
+                typ="frame",
+                lines=True,
+                dtype=False,
+                convert_dates=False,
             )
         )
 
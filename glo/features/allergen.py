@@ -215,6 +215,11 @@ class ASCIIAllergenParser(BaseAllergyParser):
         return allergen_list
 
 
+# Shared default parser, so callers that don't bring their own parser
+# all reuse the same instance.
+DEFAULT_PARSER = ASCIIAllergenParser()
+
+
 class PandasParseAllergen(PandasBaseTransform):
     """
     Set ``allergens`` column of dataset to parsed allergens.
@@ -223,7 +228,7 @@ class PandasParseAllergen(PandasBaseTransform):
     ----------
     parser: BaseAllergyParser
         Set ``parser`` attribute. Defaults to
-        ``glo.features.allergen.ASCIIAllergenParser()``
+        ``glo.features.allergen.DEFAULT_PARSER``.
 
     Attributes
     ----------
@@ -233,7 +238,7 @@ class PandasParseAllergen(PandasBaseTransform):
 
     def __init__(
         self,
-        parser: BaseAllergyParser = ASCIIAllergenParser(),
+        parser: BaseAllergyParser = DEFAULT_PARSER,
         **kwargs,
     ):
         self.parser = parser
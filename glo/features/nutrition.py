@@ -2,7 +2,10 @@
 # -*- coding: utf-8 -*-
 """Tools for working with and representing nutrition information."""
 from typing import Any, Callable, Iterable, Mapping, Union, List
-import collections
+import functools
+import itertools
+import operator
+import sys
 import warnings
 
 import numpy as np
@@ -13,12 +16,22 @@ from glo.units import (
     Q_,
     ureg,
     BaseUnitParser,
-    ASCIIUnitParser,
+    DEFAULT_PARSER,
     get_quantity_from_str,
+    parse_quantity,
+    convert_quantity,
+    combine_quantities,
+    scale_quantities,
 )
 from glo.transform import BaseTransform, PandasBaseTransform, filter_nan_wrap
 
 
+# shared by every NutritionFact created without a quantity, which is
+# safe since quantities are replaced rather than modified in place
+_ZERO_Q = Q_(0, None)
+# avoids parsing the unit string on every operation with a scalar
+_DIMENSIONLESS = ureg.dimensionless
+
 _NFOperator = Callable[
     ["NutritionFact", Union["NutritionFact", ureg.Quantity, int, float]],
     "NutritionFact",
@@ -65,27 +78,92 @@ def _operator_overload_wrap(operator_func: _NFOperator) -> _NFOperator:
     """
 
     def _wrapped(self, other):
-        if isinstance(other, ureg.Quantity):
-            quantity_param = other
-        elif isinstance(other, NutritionFact):
-            if other.name != self.name:
-                raise ValueError(
-                    "Refusing to operator on two NutritionFacts with "
-                    f"mismatch names: {self.name} != {other.name}"
-                )
-            quantity_param = other.quantity
-        elif isinstance(other, (float, int)):
-            quantity_param = Q_(other, "dimensionless")
-        else:
-            raise TypeError(
-                f"Invalid type for operation with NutritionFact: {type(other)}"
-            )
-
-        return operator_func(self, quantity_param)
+        handler = _OPERAND_HANDLERS.get(type(other))
+        if handler is None:
+            handler = _find_operand_handler(other)
+        return operator_func(self, handler(self, other))
 
     return _wrapped
 
 
+def _intern_name(name: Any) -> Any:
+    """Return interned nutrition fact name, which is cheap to compare."""
+
+    # str subclasses such as numpy.str_ can't be interned directly
+    if type(name) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(name)
+    if isinstance(name, str):
+        return sys.intern(str(name))
+    return name
+
+
+# operand handlers all take the left-hand-side NutritionFact, though
+# only the name check for NutritionFact operands needs it
+def _quantity_operand(
+    _nut_fact: "NutritionFact", other: ureg.Quantity
+) -> ureg.Quantity:
+    return other
+
+
+def _fact_operand(
+    nut_fact: "NutritionFact", other: "NutritionFact"
+) -> ureg.Quantity:
+    if other.name != nut_fact.name:
+        raise ValueError(
+            "Refusing to operator on two NutritionFacts with "
+            f"mismatch names: {nut_fact.name} != {other.name}"
+        )
+    return other.quantity
+
+
+def _scalar_operand(
+    _nut_fact: "NutritionFact", other: Union[int, float]
+) -> ureg.Quantity:
+    return Q_(other, _DIMENSIONLESS)
+
+
+def _find_operand_handler(other: Any) -> Callable:
+    """
+    Return operand handler for ``other`` using ``isinstance`` checks.
+
+    Used as a fallback for subclasses, which aren't found in
+    ``_OPERAND_HANDLERS``.
+    """
+
+    if isinstance(other, ureg.Quantity):
+        return _quantity_operand
+    if isinstance(other, NutritionFact):
+        return _fact_operand
+    if isinstance(other, (float, int)):
+        return _scalar_operand
+    raise TypeError(
+        f"Invalid type for operation with NutritionFact: {type(other)}"
+    )
+
+
+def _add_fact_quantity(
+    nut_fact: "NutritionFact",
+    quantity: Quantity,
+    op: Callable[[Any, Any], Any] = operator.add,
+) -> "NutritionFact":
+    """Add, or with ``op`` subtract, quantity without operand checks."""
+
+    if float(quantity.m) == 0.0:
+        result_quantity = nut_fact.quantity
+    elif float(nut_fact.amount) == 0.0:
+        result_quantity = quantity if op is operator.add else -quantity
+    else:
+        result_quantity = combine_quantities(nut_fact.quantity, quantity, op)
+
+    return NutritionFact(nut_fact.name, result_quantity)
+
+
+def _sub_fact_quantity(
+    nut_fact: "NutritionFact", quantity: Quantity
+) -> "NutritionFact":
+    return _add_fact_quantity(nut_fact, quantity, operator.sub)
+
+
 class NutritionFact:
     """
     Representation of a basic nutrition fact (essentially a named unit).
@@ -170,14 +248,14 @@ class NutritionFact:
     ):
         """NutritionFact constructor."""
 
-        self._name = name
+        self._name = _intern_name(name)
         self.parser = parser
 
         if quantity is None:
-            self.quantity = Q_(0, None)
+            self.quantity = _ZERO_Q
         elif isinstance(quantity, str):
             if parser is None:
-                self.quantity = Q_(quantity)
+                self.quantity = parse_quantity(quantity)
             else:
                 self.quantity = get_quantity_from_str(
                     quantity, self.parser
@@ -185,35 +263,21 @@ class NutritionFact:
         else:
             self.quantity = quantity
 
-    @_operator_overload_wrap
-    def __add__(self, quantity):
-        if float(quantity.m) == 0.0:
-            result_quantity = self.quantity
-        elif float(self.amount) == 0.0:
-            result_quantity = quantity
-        else:
-            result_quantity = self.quantity + quantity
-
-        return NutritionFact(self.name, result_quantity)
-
-    @_operator_overload_wrap
-    def __sub__(self, quantity):
-        if float(quantity.m) == 0.0:
-            result_quantity = self.quantity
-        elif float(self.amount) == 0.0:
-            result_quantity = -quantity
-        else:
-            result_quantity = self.quantity - quantity
-
-        return NutritionFact(self.name, result_quantity)
+    __add__ = _operator_overload_wrap(_add_fact_quantity)
+    __sub__ = _operator_overload_wrap(_sub_fact_quantity)
 
     @_operator_overload_wrap
     def __mul__(self, other):
-        return NutritionFact(self.name, self.quantity * other)
+        return NutritionFact(
+            self.name, scale_quantities(self.quantity, other, operator.mul)
+        )
 
     @_operator_overload_wrap
     def __truediv__(self, other):
-        return NutritionFact(self.name, self.quantity / other)
+        return NutritionFact(
+            self.name,
+            scale_quantities(self.quantity, other, operator.truediv),
+        )
 
     def __eq__(self, other):
         @_operator_overload_wrap
@@ -225,10 +289,12 @@ class NutritionFact:
         except ValueError:
             return False
 
-    @property
-    def name(self):
-        """Name of given nutrition fact this instance represents."""
-        return self._name
+    # the getter is implemented in C, so reading the name stays cheap,
+    # and without a setter the name can't be reassigned
+    name = property(
+        operator.attrgetter("_name"),
+        doc="Name of given nutrition fact this instance represents.",
+    )
 
     @property
     def amount(self):
@@ -246,14 +312,24 @@ class NutritionFact:
 
     @units.setter
     def units(self, units: Unit):
-        self.quantity = self.quantity.to(units)
+        self.quantity = convert_quantity(self.quantity, units)
 
 
-class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
+# maps exact operand types to the function that turns them into a
+# quantity, so the common cases skip the chain of isinstance checks
+_OPERAND_HANDLERS = {
+    ureg.Quantity: _quantity_operand,
+    NutritionFact: _fact_operand,
+    float: _scalar_operand,
+    int: _scalar_operand,
+}
+
+
+class NutritionSet(dict):
     """
     Dictionary representation of a group of ``NutritionFact``.
 
-    This class inherits from ``collections.UserDict`` and is tailored
+    This class inherits from ``dict`` and is tailored
     to make working with ``NutritionFact`` much easier. Keys in this
     specialized dictionary are the string names of ``NutritionFact``
     and values are the ``NutritionFact`` themselves.
@@ -272,8 +348,13 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
     from_dict:
         Return a new NutritionSet from a given dictionary. See method
         docstring below.
+    from_records:
+        Return a new NutritionSet from parallel sequences of names,
+        magnitudes and units. See method docstring below.
     clear:
         See ``dict.clear``.
+    copy:
+        Return a shallow copy, as a ``NutritionSet``.
     get:
         See ``dict.get``.
     items:
@@ -316,10 +397,14 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
     300
     """
 
+    # no per-instance __dict__, everything lives in the dict itself
+    __slots__ = ()
+
     def __init__(self, *facts: NutritionFact):
         """NutritionSet constructor."""
 
-        super().__init__(facts)
+        super().__init__()
+        self.update(facts)
 
     @staticmethod
     def _is_valid_key(key: str) -> None:
@@ -335,15 +420,15 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
         if not isinstance(key, str):
             raise TypeError(f"Expected type str, instead got {type(key)}")
 
-    def __getitem__(self, key) -> NutritionFact:
+    def __missing__(self, key) -> NutritionFact:
+        # dict.__getitem__ calls this for missing keys, and since only
+        # str keys can be stored, invalid keys always end up here too
         self._is_valid_key(key)
-        try:
-            return super().__getitem__(key)
-        except KeyError:
-            return NutritionFact(key, None)
+        return NutritionFact(key, None)
 
     def __setitem__(self, key, value) -> None:
         self._is_valid_key(key)
+        key = _intern_name(key)
         if isinstance(value, ureg.Quantity):
             super().__setitem__(key, NutritionFact(key, value))
         elif isinstance(value, NutritionFact):
@@ -358,7 +443,11 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
 
         ret_ns = NutritionSet()
         ret_ns.update(self)
-        ret_ns.update(other, merge_func=lambda a, b: a - b)
+        # facts are merged by name, so the checks done by
+        # NutritionFact.__sub__ can be skipped
+        ret_ns.update(
+            other, merge_func=lambda a, b: _sub_fact_quantity(a, b.quantity)
+        )
         return ret_ns
 
     def __add__(self, other: _NSCompatibleTypes) -> "NutritionSet":
@@ -366,9 +455,30 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
 
         ret_ns = NutritionSet()
         ret_ns.update(self)
-        ret_ns.update(other, merge_func=lambda a, b: a + b)
+        # facts are merged by name, so the checks done by
+        # NutritionFact.__add__ can be skipped
+        ret_ns.update(
+            other, merge_func=lambda a, b: _add_fact_quantity(a, b.quantity)
+        )
         return ret_ns
 
+    def copy(self) -> "NutritionSet":
+        # dict.copy would return a plain dict
+        return type(self)(*self.values())
+
+    def get(  # pylint: disable=unused-argument
+        self, key, default=None
+    ) -> NutritionFact:
+        # like [], missing facts are returned with a zero quantity
+        return self[key]
+
+    def setdefault(self, key, default=None) -> NutritionFact:
+        # without a default, missing facts are returned with a zero
+        # quantity and aren't stored, same as []
+        if default is not None and key not in self:
+            self[key] = default
+        return self[key]
+
     def __eq__(self, other: _NSCompatibleTypes) -> bool:
         """Determine if two NutritionSets are equal."""
 
@@ -384,6 +494,10 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
 
         return True
 
+    def __ne__(self, other: _NSCompatibleTypes) -> bool:
+        # dict.__ne__ would otherwise skip the __eq__ defined above
+        return not self == other
+
     def as_dict(self) -> Mapping[str, Quantity]:
         """
         Return ``dict`` representing this ``NutritionSet``.
@@ -392,7 +506,7 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
         values are their associated Quantity in this ``NutritionSet``.
         """
 
-        return {nf.name: nf.quantity for nf in self.data.values()}
+        return {nf.name: nf.quantity for nf in self.values()}
 
     @classmethod
     def from_dict(
@@ -426,6 +540,114 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
             ]
         )
 
+    @classmethod
+    def from_records(
+        cls,
+        names: Iterable[str],
+        magnitudes: Iterable[Union[int, float]],
+        units: Union[Unit, str, Iterable[Union[Unit, str]]],
+    ) -> "NutritionSet":
+        """
+        Creates a new ``NutritionSet`` from names and magnitudes.
+
+        Each distinct unit is parsed once and shared by every created
+        ``NutritionFact`` using it, which is much cheaper than parsing
+        a quantity string per fact when reading tabular data.
+
+        Parameters
+        ----------
+        names: iterable of str
+            ``NutritionFact`` names, such as a list or a numpy array.
+        magnitudes: iterable of int or float
+            Amount of each nutrition fact, in the same order as
+            ``names``.
+        units: pint Unit or str, or iterable of them
+            Either a unit shared by all of the given magnitudes, or
+            the unit of each magnitude, in the same order as
+            ``names``.
+
+        Returns
+        -------
+        NutritionSet
+
+        Examples
+        --------
+        >>> from glo.features.nutrition import NutritionSet
+        >>> ns = NutritionSet.from_records(["fat", "protein"], [1, 5], "g")
+        >>> ns["protein"].quantity
+        <Quantity(5, 'gram')>
+        >>> ns = NutritionSet.from_records(["fat", "na"], [1, 5], ["g", "mg"])
+        >>> ns["na"].quantity
+        <Quantity(5, 'milligram')>
+        """
+
+        if isinstance(units, (Unit, str)):
+            units = itertools.repeat(units)
+        parsed = dict()
+        result = cls()
+        for name, magnitude, unit in zip(names, magnitudes, units):
+            try:
+                unit = parsed[unit]
+            except KeyError:
+                unit = parsed[unit] = ureg.Unit(unit)
+            result[name] = NutritionFact(name, Q_(magnitude, unit))
+        return result
+
+    @classmethod
+    def sum_bulk(cls, nut_sets: Iterable["NutritionSet"]) -> "NutritionSet":
+        """
+        Return the sum of the given ``NutritionSet`` instances.
+
+        Gives the same result as adding the sets together one after
+        another with ``+``. Rather than adding pint quantities pairwise,
+        the magnitudes of each nutrition fact are grouped by unit and
+        summed with numpy, so each unit only needs to be converted
+        once.
+
+        Parameters
+        ----------
+        nut_sets: iterable of NutritionSet
+            Sets to sum together.
+
+        Returns
+        -------
+        NutritionSet
+
+        Examples
+        --------
+        >>> from glo.features.nutrition import NutritionSet
+        >>> from glo.units import Q_
+        >>> ns1 = NutritionSet.from_dict({"fat": Q_(1, "g")})
+        >>> ns2 = NutritionSet.from_dict({"fat": Q_(500, "mg")})
+        >>> NutritionSet.sum_bulk([ns1, ns2, ns2])["fat"].quantity
+        <Quantity(2.0, 'gram')>
+        """
+
+        # facts with a zero amount don't contribute to a sum, see
+        # NutritionFact.__add__, so they only matter when a fact is
+        # zero in every set
+        firsts = dict()
+        magnitudes = dict()
+        for i, nut_set in enumerate(nut_sets):
+            for name, nut_fact in nut_set.items():
+                if name not in firsts:
+                    firsts[name] = nut_fact.quantity if i == 0 else _ZERO_Q
+                if float(nut_fact.amount) != 0.0:
+                    magnitudes.setdefault(name, dict()).setdefault(
+                        nut_fact.units, []
+                    ).append(nut_fact.amount)
+
+        result = cls()
+        for name, first in firsts.items():
+            unit_sums = [
+                Q_(np.sum(unit_mags).item(), units)
+                for units, unit_mags in magnitudes.get(name, dict()).items()
+            ]
+            result[name] = (
+                sum(unit_sums[1:], unit_sums[0]) if unit_sums else first
+            )
+        return result
+
     def update(
         self,
         other: _NSCompatibleTypes,
@@ -479,7 +701,7 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
         >>> my_ns.get("fat").amount
         5
         >>> # Clear my_ns
-        >>> my_ns.data = dict()
+        >>> my_ns.clear()
         >>> my_ns.update(
         ...    {nf.name: nf.quantity for nf in [sodium, protein, fat]}
         ... )
@@ -496,42 +718,89 @@ class NutritionSet(collections.UserDict):  # pylint: disable=too-many-ancestors
         >>> my_ns["sodium"].amount
         40
         """
-        if isinstance(other, NutritionFact):
-            if merge_func is not None:
-                self[other.name] = merge_func(self[other.name], other)
-            else:
-                self.__setitem__(other.name, other)
-        elif isinstance(other, dict):
-            for name, quantity in other.items():
-                if not isinstance(quantity, Quantity):
-                    raise TypeError(
-                        "Expected mapping of str -> Quantity, instead got: "
-                        f"{type(name)} -> {type(quantity)}"
-                    )
-                self.update(
-                    NutritionFact(name, quantity), merge_func=merge_func
-                )
-        elif isinstance(other, NutritionSet):
-            for name, nut_fact in other.data.items():
-                self.update(nut_fact, merge_func=merge_func)
-        else:  # try assuming iterable
-            try:
-                for nut_fact in other:
-                    if not isinstance(nut_fact, NutritionFact):
-                        raise TypeError(
-                            "Expected iterable to be of NutritionFact "
-                            f"instances, instead got {type(nut_fact)}"
-                        )
-                    self.update(nut_fact, merge_func=merge_func)
-            except TypeError as exception:
-                if "not iterable" in exception.args[0]:
-                    raise TypeError(
-                        "Expected one of NutritionFact, "
-                        "Mapping[str, Quantity] or NutritionSet, "
-                        f"instead got: {type(other)}"
-                    ) from exception
-
-                raise exception
+
+        _update_nutrition_set(other, self, merge_func)
+
+
+# NutritionSet.update dispatches on the type of its argument, falling
+# back to treating it as an iterable of NutritionFact
+@functools.singledispatch
+def _update_nutrition_set(
+    other: Iterable[NutritionFact],
+    nut_set: NutritionSet,
+    merge_func: Union[None, Callable[[Any, Any], Any]],
+) -> None:
+    try:
+        facts = list(other)
+    except TypeError as exception:
+        if "not iterable" in exception.args[0]:
+            raise TypeError(
+                "Expected one of NutritionFact, "
+                "Mapping[str, Quantity] or NutritionSet, "
+                f"instead got: {type(other)}"
+            ) from exception
+
+        raise exception
+
+    for nut_fact in facts:
+        if not isinstance(nut_fact, NutritionFact):
+            raise TypeError(
+                "Expected iterable to be of NutritionFact "
+                f"instances, instead got {type(nut_fact)}"
+            )
+    if merge_func is None:
+        # names are interned by NutritionFact, so skip __setitem__
+        dict.update(nut_set, ((fact.name, fact) for fact in facts))
+    else:
+        for fact in facts:
+            _update_from_fact(fact, nut_set, merge_func)
+
+
+@_update_nutrition_set.register(NutritionFact)
+def _update_from_fact(
+    other: NutritionFact,
+    nut_set: NutritionSet,
+    merge_func: Union[None, Callable[[Any, Any], Any]],
+) -> None:
+    if merge_func is not None:
+        nut_set[other.name] = merge_func(nut_set[other.name], other)
+    else:
+        nut_set[other.name] = other
+
+
+@_update_nutrition_set.register(NutritionSet)
+def _update_from_set(
+    other: NutritionSet,
+    nut_set: NutritionSet,
+    merge_func: Union[None, Callable[[Any, Any], Any]],
+) -> None:
+    if merge_func is None:
+        dict.update(nut_set, other)
+    else:
+        for nut_fact in other.values():
+            _update_from_fact(nut_fact, nut_set, merge_func)
+
+
+@_update_nutrition_set.register(dict)
+def _update_from_dict(
+    other: Mapping[str, Quantity],
+    nut_set: NutritionSet,
+    merge_func: Union[None, Callable[[Any, Any], Any]],
+) -> None:
+    for name, quantity in other.items():
+        NutritionSet._is_valid_key(name)  # pylint: disable=protected-access
+        if not isinstance(quantity, Quantity):
+            raise TypeError(
+                "Expected mapping of str -> Quantity, instead got: "
+                f"{type(name)} -> {type(quantity)}"
+            )
+    facts = (NutritionFact(name, quantity) for name, quantity in other.items())
+    if merge_func is None:
+        # everything has been validated, so skip __setitem__
+        dict.update(nut_set, ((fact.name, fact) for fact in facts))
+    else:
+        for fact in facts:
+            _update_from_fact(fact, nut_set, merge_func)
 
 
 class NutritionNormalizer(BaseTransform):
@@ -607,7 +876,7 @@ class PandasParseNutrition(PandasBaseTransform):
     ----------
     parser: BaseUnitParser
         Set ``parser`` attribute. Defaults to
-        ``glo.features.serving.ASCIIUnitParser()``.
+        ``glo.units.DEFAULT_PARSER``.
 
     Attributes
     ----------
@@ -620,7 +889,7 @@ class PandasParseNutrition(PandasBaseTransform):
     glo.features.nutrition.NutritionSet
     """
 
-    def __init__(self, parser: BaseUnitParser = ASCIIUnitParser(), **kwargs):
+    def __init__(self, parser: BaseUnitParser = DEFAULT_PARSER, **kwargs):
         self.parser = parser
         super().__init__(**kwargs)
 
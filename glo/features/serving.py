@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tools for working with and representing nutrition information."""
 from typing import Callable, Union
+import functools
 import warnings
 import pandas as pd
 import numpy as np
@@ -11,17 +12,23 @@ from glo.units import (
     Q_class,
     simplified_div,
     BaseUnitParser,
-    ASCIIUnitParser,
+    DEFAULT_PARSER,
     ureg,
+    parse_quantity,
 )
 from glo.transform import PandasBaseTransform, filter_nan_wrap
 
+# registry attribute lookups build a new Unit each time, so the units
+# checked by PandasParseServing.div_func are looked up once
+_OUNCE = ureg.ounce
+_FLUID_OUNCE = ureg.fluid_ounce
+
 
 def get_num_servings(
     weight: str,
     serving_size: str,
     div_func: Callable[[Q_class, Q_class], float] = simplified_div,
-    unit_parser: BaseUnitParser = ASCIIUnitParser(),
+    unit_parser: BaseUnitParser = DEFAULT_PARSER,
 ) -> float:
     """
     Return number of servings based on weight and serving size.
@@ -71,12 +78,36 @@ def get_num_servings(
     ASCIIUnitParser
     """
 
+    # only the defaults are cached, since custom division functions and
+    # parsers aren't guaranteed to be deterministic or hashable
+    if div_func is simplified_div and unit_parser is DEFAULT_PARSER:
+        return _get_default_num_servings(weight, serving_size)
+    return _find_num_servings(weight, serving_size, div_func, unit_parser)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_default_num_servings(weight: str, serving_size: str) -> float:
+    """``get_num_servings`` with default arguments, memoized."""
+
+    return _find_num_servings(
+        weight, serving_size, simplified_div, DEFAULT_PARSER
+    )
+
+
+def _find_num_servings(
+    weight: str,
+    serving_size: str,
+    div_func: Callable[[Q_class, Q_class], float],
+    unit_parser: BaseUnitParser,
+) -> float:
+    """Body of ``get_num_servings``."""
+
     weight_strs = unit_parser.find_unit_strs(weight)
     ss_strs = unit_parser.find_unit_strs(serving_size)
     for w_str in weight_strs:
         for s_str in ss_strs:
             try:
-                w_qt, s_qt = Q_(w_str), Q_(s_str)
+                w_qt, s_qt = parse_quantity(w_str), parse_quantity(s_str)
                 return div_func(w_qt, s_qt)
             except (UndefinedUnitError, TypeError):
                 pass
@@ -99,7 +130,7 @@ class PandasParseServing(PandasBaseTransform):
     ----------
     parser: BaseUnitParser
         Set ``parser`` attribute. Defaults to
-        ``glo.features.serving.ASCIIUnitParser()``.
+        ``glo.units.DEFAULT_PARSER``.
 
     Attributes
     ----------
@@ -108,7 +139,7 @@ class PandasParseServing(PandasBaseTransform):
         ``glo.features.serving.get_num_servings``.
     """
 
-    def __init__(self, parser: BaseUnitParser = ASCIIUnitParser(), **kwargs):
+    def __init__(self, parser: BaseUnitParser = DEFAULT_PARSER, **kwargs):
         self.parser = parser
         super().__init__(**kwargs)
 
@@ -146,23 +177,16 @@ class PandasParseServing(PandasBaseTransform):
         glo.units.simplified_div
         """
 
-        if q1.units == ureg.ounce and q2.units.is_compatible_with(
-            ureg.fluid_ounce
-        ):
-            q1 = Q_(q1.magnitude, ureg.fluid_ounce)
-        elif q2.units == ureg.ounce and q1.units.is_compatible_with(
-            ureg.fluid_ounce
-        ):
-            q2 = Q_(q2.magnitude, ureg.fluid_ounce)
+        if q1.units == _OUNCE and q2.units.is_compatible_with(_FLUID_OUNCE):
+            q1 = Q_(q1.magnitude, _FLUID_OUNCE)
+        elif q2.units == _OUNCE and q1.units.is_compatible_with(_FLUID_OUNCE):
+            q2 = Q_(q2.magnitude, _FLUID_OUNCE)
 
         return simplified_div(q1, q2)
 
-    @filter_nan_wrap
-    def transform_series(self, series: pd.Series) -> Union[pd.Series, float]:
-        result = series.copy(deep=True)
+    def _get_servings(self, weight: str, serving_size: str) -> float:
+        """Return number of servings, or ``np.nan`` if it can't be found."""
 
-        weight = series["weight"]
-        serving_size = series["serving"]
         try:
             servings = get_num_servings(
                 weight,
@@ -174,5 +198,48 @@ class PandasParseServing(PandasBaseTransform):
             warnings.warn(exception.args[0], RuntimeWarning)
             return np.nan
 
-        result["servings"] = np.float64(servings)
+        return np.float64(servings)
+
+    @filter_nan_wrap
+    def transform_series(self, series: pd.Series) -> Union[pd.Series, float]:
+        servings = self._get_servings(series["weight"], series["serving"])
+        if np.isnan(servings):
+            return np.nan
+
+        # only a new column is added, so a shallow copy keeps the
+        # given row untouched without duplicating its values
+        result = series.copy(deep=False)
+        result["servings"] = servings
+        return result
+
+    def transform_dataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add the ``servings`` column to the given dataframe.
+
+        Rather than transforming the dataframe row-by-row, the number
+        of servings is determined once for each unique pair of weight
+        and serving size and the column is assigned in one go. Rows
+        for which the number of servings cannot be determined are set
+        to ``np.nan``, and rows that are already ``np.nan`` are left
+        as-is.
+
+        Parameters
+        ----------
+        dataframe: pd.DataFrame
+            Pandas DataFrame to transform.
+        """
+
+        result = dataframe.copy()
+        skip = result.isna().all(axis=1).to_numpy()
+        servings = np.full(len(result), np.nan, dtype=np.float64)
+        found = dict()
+        for i, pair in enumerate(zip(result["weight"], result["serving"])):
+            if skip[i]:
+                continue
+            if pair not in found:
+                found[pair] = self._get_servings(*pair)
+            servings[i] = found[pair]
+
+        result["servings"] = servings
+        result.loc[np.isnan(servings) & ~skip, :] = np.nan
         return result
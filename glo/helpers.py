@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Helper functions and classes."""
-from typing import Callable, Iterable, List, Mapping, Tuple, Type
+from typing import Callable, Iterable, List, Mapping, Pattern, Tuple, Type
+import re
 import string
 import functools
+import itertools
+from operator import attrgetter
 
 
 _registry = dict()
-_printable = set(string.printable)
+_get_class = attrgetter("__class__")
+# ascii bytes that prep_ascii_str should delete, since they aren't in
+# string.printable
+_non_printable = bytes(i for i in range(128) if chr(i) not in string.printable)
 
 
 class MultiMethod:
@@ -17,7 +23,9 @@ class MultiMethod:
     Takes in the name of a function and allows for registering
     various signatures with different types. When an instance of
     this class is called, the appropriated function is called based
-    on the types of the given arguments.
+    on the types of the given arguments. Arguments that don't match a
+    signature exactly fall back to the first signature matching the
+    classes in their MROs.
 
     From a tutorial written by Guido van Rossum.  Please see
     https://www.artima.com/weblogs/viewpost.jsp?thread=101605
@@ -31,14 +39,39 @@ class MultiMethod:
     def __init__(self, name):
         self.name = name
         self.typemap = dict()
+        # single-argument signatures keyed by the bare class, so the
+        # common case doesn't need to build a tuple of types
+        self._unary = dict()
+        # signatures resolved through the argument MROs, including
+        # those that didn't match anything
+        self._resolved = dict()
 
     def __call__(self, *args):
-        types = tuple(arg.__class__ for arg in args)
-        function = self.typemap.get(types)
+        if len(args) == 1:
+            function = self._unary.get(args[0].__class__)
+        else:
+            function = self.typemap.get(tuple(map(_get_class, args)))
         if function is None:
-            raise TypeError("No match for overloaded function.")
+            function = self._resolve(tuple(map(_get_class, args)))
         return function(*args)
 
+    def _resolve(self, types: Tuple[Type, ...]) -> Callable:
+        """Find the function registered for base classes of ``types``."""
+
+        try:
+            function = self._resolved[types]
+        except KeyError:
+            function = None
+            for bases in itertools.product(*(t.__mro__ for t in types)):
+                function = self.typemap.get(bases)
+                if function is not None:
+                    break
+            self._resolved[types] = function
+
+        if function is None:
+            raise TypeError("No match for overloaded function.")
+        return function
+
     def register(self, types: Tuple[Type, ...], function: Callable) -> None:
         """
         Register a new function signature.
@@ -59,6 +92,9 @@ class MultiMethod:
         if types in self.typemap:
             raise TypeError(f"Duplicate registration of function {self.name}")
         self.typemap[types] = function
+        if len(types) == 1:
+            self._unary[types[0]] = function
+        self._resolved.clear()
 
 
 def multimethod(*types: Type) -> Callable:
@@ -128,7 +164,13 @@ def prep_ascii_str(s_in: str) -> str:
     'some string with whitespace'
     """
 
-    as_ascii = "".join(filter(lambda x: x in _printable, s_in))
+    # encoding drops everything outside of ascii, translate drops the
+    # remaining control characters
+    as_ascii = (
+        s_in.encode("ascii", "ignore")
+        .translate(None, _non_printable)
+        .decode("ascii")
+    )
     return as_ascii.strip().lower()
 
 
@@ -161,11 +203,9 @@ def remove_substrings(s_in: str, subs: Iterable[str]) -> str:
     'he'
     """
 
-    return functools.reduce(
-        lambda string, substring: string.replace(substring, "").strip(),
-        subs,
-        s_in,
-    )
+    for substring in subs:
+        s_in = s_in.replace(substring, "").strip()
+    return s_in
 
 
 def split_in_list(in_list: Iterable[str], split_on: str) -> List[str]:
@@ -210,12 +250,14 @@ def split_in_list(in_list: Iterable[str], split_on: str) -> List[str]:
     ['and then', 'he said:', 'wait', "what's that?"]
     """
 
-    return functools.reduce(
-        lambda results, next_str: results
-        + [sub.strip() for sub in next_str.split(split_on)],
-        in_list,
-        list(),
-    )
+    return [sub.strip() for s_in in in_list for sub in s_in.split(split_on)]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_alternation(subs: Tuple[str, ...]) -> Pattern:
+    """Return compiled pattern matching any of the given substrings."""
+
+    return re.compile("|".join(map(re.escape, subs)))
 
 
 def contains_substring(s_in: str, subs: Iterable[str]) -> bool:
@@ -240,9 +282,16 @@ def contains_substring(s_in: str, subs: Iterable[str]) -> bool:
     True
     >>> contains_substring("THIS IS ANOTHER TEST", ["this", "is", "another"])
     False
+    >>> contains_substring("this is a test", [])
+    False
     """
 
-    return any(sub_str in s_in for sub_str in subs)
+    # searching for all substrings at once with a cached pattern keeps
+    # the loop over them out of python
+    subs = tuple(subs)
+    if len(subs) == 0:
+        return False
+    return _compile_alternation(subs).search(s_in) is not None
 
 
 def replace_multiple_substrings(s_in: str, subs: Mapping[str, str]) -> str:
@@ -11,8 +11,7 @@ References:
   * https://github.com/PyTorchLightning/Lightning-Bolts/blob/master/pl_bolts/models/rl/dqn_model.py#L33-L405
 """
 import random
-import math
-from typing import Callable, List, Tuple, Dict
+from typing import Callable, Iterator, List, Tuple, Dict
 from collections import namedtuple, deque, OrderedDict
 import numpy as np
 
@@ -52,15 +51,23 @@ class Environment:
 
     def __init__(self, dm: ScrapyKingSoopersDataModule, gc_size: int):
         self.dm = dm
-        self.items = self.dm.ks_norm_numpy
+        # float32 to match the networks, so states don't need to be
+        # converted before every forward pass, and c-contiguous so each
+        # row copied into the state is a single block of memory
+        self.items = np.ascontiguousarray(
+            self.dm.ks_norm_numpy, dtype=np.float32
+        )
         self.gc_size = gc_size
+        # written into the state for empty slots, rather than
+        # allocating new zeros on every step
+        self._empty_item = np.zeros(len(self.items[0]), dtype=np.float32)
         self.state = None
         self.reset()
 
     def reset(self):
         self.state = (
-            np.zeros(self.gc_size, dtype=np.float64),
-            np.zeros((self.gc_size, len(self.items[0])), dtype=np.float64)
+            np.zeros(self.gc_size, dtype=np.float32),
+            np.zeros((self.gc_size, len(self.items[0])), dtype=np.float32)
         )
 
     @staticmethod
@@ -78,27 +85,24 @@ class Environment:
         # 0 and 1 -> 0
         # 2 and 3 -> 1
         # 4 and 5 -> 2
-        action_index = math.floor(action / 2)
+        action_index = action >> 1
 
         # odd is cw, even is ccw
-        if action % 2 == 0:
-            direction = -1
-        else:
-            direction = 1
+        direction = ((action & 1) << 1) - 1
 
         max_items = len(self.items)
-        prev_index = self.state[0][action_index]
-        new_index = int((prev_index + direction))
-
-        if new_index == max_items or new_index == -1:
-            self.state[0][action_index] = max_items
-            self.state[1][action_index] = np.zeros(self.items[0].shape)
-        elif new_index == max_items + 1 or new_index == 0:
-            self.state[0][action_index] = 0
-            self.state[1][action_index] = self.items[0]
+        state_index, state_items = self.state
+        # indices wrap around through max_items, which represents an
+        # empty slot
+        new_index = (int(state_index[action_index]) + direction) % (
+            max_items + 1
+        )
+
+        state_index[action_index] = new_index
+        if new_index == max_items:
+            state_items[action_index] = self._empty_item
         else:
-            self.state[0][action_index] = new_index
-            self.state[1][action_index] = self.items[new_index]
+            state_items[action_index] = self.items[new_index]
 
 
 class ReplayMemory:
@@ -112,8 +116,12 @@ class ReplayMemory:
 
     Attributes
     ----------
-    memory
-        ``collections.deque`` instance representing internal memory.
+    capacity: int
+        Max memory capacity.
+    states, actions, rewards, dones, new_states: np.ndarray
+        Ring buffers holding each field of the saved transitions, with
+        states flattened. Allocated on the first ``push``, once the
+        size of a state is known.
 
     Notes
     -----
@@ -130,23 +138,51 @@ class ReplayMemory:
     """
 
     def __init__(self, capacity: int):
-        self.memory = deque([], maxlen=capacity)
+        self.capacity = capacity
+        self.states = None
+        self.actions = None
+        self.rewards = None
+        self.dones = None
+        self.new_states = None
+        self._size = 0
+        self._pos = 0
 
     def __len__(self):
-        return len(self.memory)
+        return self._size
+
+    def _allocate(self, n_features: int):
+        self.states = np.empty((self.capacity, n_features), dtype=np.float32)
+        self.actions = np.empty(self.capacity, dtype=np.int64)
+        self.rewards = np.empty(self.capacity, dtype=np.float32)
+        self.dones = np.empty(self.capacity, dtype=np.bool_)
+        self.new_states = np.empty_like(self.states)
 
     def push(self, *args):
         """
         Save a ``Transition`` into memory.
 
         args given are passed directly to a new ``Transition`` instance.
+        Once memory is full, the oldest transition is overwritten.
 
         See Also
         --------
         Transition
         """
 
-        self.memory.append(Transition(*args))
+        transition = Transition(*args)
+        state = np.ravel(transition.state)
+        if self.states is None:
+            self._allocate(state.size)
+
+        pos = self._pos
+        self.states[pos] = state
+        self.actions[pos] = transition.action
+        self.rewards[pos] = transition.reward
+        self.dones[pos] = transition.done
+        self.new_states[pos] = np.ravel(transition.new_state)
+
+        self._pos = (pos + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
 
     def sample(self, batch_size: int):
         """
@@ -158,20 +194,14 @@ class ReplayMemory:
             Number of random samples to return.
         """
 
-        states = []
-        actions = []
-        reward = []
-        done = []
-        new_state = []
-
-        for samp in random.sample(self.memory, batch_size):
-            states.append(samp[0].flatten().astype(np.float32))
-            actions.append(samp[1])
-            reward.append(samp[2].astype(np.float32))
-            done.append(samp[3])
-            new_state.append(samp[4].flatten().astype(np.float32))
-
-        return states, actions, reward, done, new_state
+        idx = np.random.choice(self._size, batch_size, replace=False)
+        return (
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.dones[idx],
+            self.new_states[idx],
+        )
 
 
 class DQN(nn.Module):
@@ -349,34 +379,46 @@ class DQModel(pl.LightningModule):
         self.memory = ReplayMemory(capacity=memory_size)
         self.dm = dm
         self.dataset = None
-        self.policy_net = DQN(
+        # scripted so that a forward pass doesn't go through python
+        # for every layer
+        self.policy_net = torch.jit.script(DQN(
             n_features=n_features,
             n_conn=n_conn,
             n_hidden=n_hidden,
             n_actions=self.n_actions
-        )
-        self.target_net = DQN(
+        ))
+        self.target_net = torch.jit.script(DQN(
             n_features=n_features,
             n_conn=n_conn,
             n_hidden=n_hidden,
             n_actions=self.n_actions
-        )
+        ))
 
         # Metrics
         self.total_episode_steps = [0]
-        self.total_rewards = [0]
         self.done_episodes = 0
         self.total_steps = 0
 
         # Average Rewards
+        # only the rewards that make up the average are kept, along
+        # with their running sum
         self.avg_reward_len = avg_reward_len
-        for _ in range(avg_reward_len):
-            self.total_rewards.append(
-                torch.tensor(self.min_episode_reward, device=self.device)
-            )
-        self.avg_rewards = float(
-            np.mean(self.total_rewards[-self.avg_reward_len:])
+        self.total_rewards = deque(
+            [float(self.min_episode_reward)] * avg_reward_len,
+            maxlen=avg_reward_len,
         )
+        self._reward_sum = float(self.min_episode_reward) * avg_reward_len
+        self.avg_rewards = float(self.min_episode_reward)
+
+    def _add_episode_reward(self, reward: float):
+        """Save reward of an episode and update the average reward."""
+
+        reward = float(reward)
+        if len(self.total_rewards) == self.total_rewards.maxlen:
+            self._reward_sum -= self.total_rewards[0]
+        self.total_rewards.append(reward)
+        self._reward_sum += reward
+        self.avg_rewards = self._reward_sum / len(self.total_rewards)
 
     @torch.no_grad()
     def update_epsilon(self, step):
@@ -390,15 +432,12 @@ class DQModel(pl.LightningModule):
 
         sample = random.random()
         if sample > epsilon:
-            net_input = torch.tensor(
-                env.state[1].flatten().astype(np.float32), device=self.device
+            net_input = torch.from_numpy(env.state[1].ravel()).to(
+                self.device, non_blocking=True
             )
-            return self.policy_net(net_input).max(-1)[1].view(1, 1).item()
+            return int(self.policy_net(net_input).argmax(-1))
         else:
-            return torch.tensor(
-                [[random.randrange(self.n_actions)]],
-                device=self.device, dtype=torch.long
-            ).item()
+            return random.randrange(self.n_actions)
 
     def run_n_episodes(
         self, env, n_episodes: int = 1, epsilon: float = 1.0
@@ -423,7 +462,7 @@ class DQModel(pl.LightningModule):
 
             while not done:
                 self.epsilon = epsilon
-                action = self.get_action(env, epsilon).item()
+                action = self.get_action(env, epsilon)
                 env.step(action)
                 reward = self.reward_func(env)
                 episode_reward += reward
@@ -441,10 +480,12 @@ class DQModel(pl.LightningModule):
             prev_reward = self.min_episode_reward
             local_steps = 0
 
-            for _ in range(warm_start):
+            # epsilon is 1.0 throughout the warm start, so every action
+            # is random and they can all be drawn up-front
+            self.epsilon = 1.0
+            actions = np.random.randint(0, self.n_actions, size=warm_start)
+            for action in actions.tolist():
                 local_steps += 1
-                self.epsilon = 1.0
-                action = self.get_action(self.env, self.epsilon)
                 self.env.step(action)
 
                 next_state = self.env.state[1]
@@ -484,14 +525,16 @@ class DQModel(pl.LightningModule):
         """
         return self.policy_net(x)
 
-    def train_batch(self) -> Transition:
+    def train_batch(self) -> Iterator[Tuple[np.ndarray, ...]]:
         """
         Contains the logic for generating a new batch of data to be passed
         to the DataLoader
 
         Yields
         ------
-        Transition
+        tuple of np.ndarray
+            Batch of ``batch_size`` transitions sampled from memory, see
+            ``ReplayMemory.sample``.
         """
 
         episode_reward = 0
@@ -516,21 +559,15 @@ class DQModel(pl.LightningModule):
 
             if is_done:
                 self.done_episodes += 1
-                self.total_rewards.append(episode_reward)
+                self._add_episode_reward(episode_reward)
                 self.total_episode_steps.append(episode_steps)
-                self.avg_rewards = float(
-                    np.mean(self.total_rewards[-self.avg_reward_len:])
-                )
                 episode_steps = 0
                 episode_reward = 0
                 prev_reward = self.min_episode_reward
 
-            states, actions, rewards, dones, new_states = self.memory.sample(
-                self.batch_size
-            )
-            for idx, _ in enumerate(dones):
-                yield states[idx], actions[idx], rewards[idx], dones[idx], \
-                      new_states[idx]
+            # memory already samples whole batches, so hand them to the
+            # dataloader as-is rather than one transition at a time
+            yield self.memory.sample(self.batch_size)
 
             if self.total_steps % self.batches_per_epoch == 0:
                 break
@@ -593,7 +630,8 @@ class DQModel(pl.LightningModule):
         self.populate(self.warm_start_size)
 
         self.dataset = ExperienceSourceDataset(self.train_batch)
-        return DataLoader(dataset=self.dataset, batch_size=self.batch_size)
+        # batching is done by ReplayMemory.sample
+        return DataLoader(dataset=self.dataset, batch_size=None)
 
     def train_dataloader(self) -> DataLoader:
         return self._dataloader()
@@ -8,6 +8,14 @@ from scrapy.loader import ItemLoader
 from itemloaders.processors import Compose, Identity, TakeFirst
 
 
+def _strip_zeros(nutrition: dict) -> dict:
+    """Remove nutrition facts whose amount starts with a zero, in-place."""
+
+    for key in [k for k, v in nutrition.items() if v[:1] == "0"]:
+        del nutrition[key]
+    return nutrition
+
+
 class KingSooperProduct(Item):  # pylint: disable=too-many-ancestors
     """Item scraped on King Sooper's website."""
 
@@ -36,9 +44,6 @@ class KingSooperProductLoader(ItemLoader):
     upc_in = Compose(TakeFirst(), lambda s: s.split(": ")[-1])
     # Sometimes we get keys with a value of unit zero
     # Want to remove these to save space
-    nutrition_in = Compose(
-        TakeFirst(),
-        lambda d: {k: v for k, v in d.items() if not v.startswith("0")},
-    )
+    nutrition_in = Compose(TakeFirst(), _strip_zeros)
     # expecting a list for this attribute
     indicators_out = Identity()
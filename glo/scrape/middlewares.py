@@ -2,15 +2,26 @@
 # -*- coding: utf-8 -*-
 """Middlewares for our scrapy spiders."""
 import os
+import itertools
 import logging
 import random
+import re
 import shutil
-import shlex
 import subprocess
+import time
 import uuid
 from scrapy import signals
 
 
+# sentinel pages served by the waf are found by the first title in the
+# head of the raw body, so only that part of the page is scanned
+_TITLE_RE = re.compile(rb"<title(?:\s[^>]*)?>([^<]*)</title>", re.IGNORECASE)
+_DENIED_TITLE = b"Access Denied"
+_HEAD_SCAN_BYTES = 16384
+_UA_HEADER = b"User-Agent"
+_VPN_TAG = "vpn-tag"
+
+
 class SplashRequestMiddleware:
     """Filter all requests to go through splash."""
 
@@ -37,8 +48,12 @@ class SplashRequestMiddleware:
 
         if self.splash_args and not request.meta.get("splash", False):
             spider.logger.debug("Crawling %s", request.url)
-            request.meta["splash"] = self.splash_args
-            request.meta["splash"]["args"]["url"] = request.url
+            # splash_args is shared by every request, so each one gets
+            # its own copy of the parts that differ
+            request.meta["splash"] = {
+                **self.splash_args,
+                "args": {**self.splash_args["args"], "url": request.url},
+            }
 
 
 class WindscribeMiddleware:
@@ -50,10 +65,16 @@ class WindscribeMiddleware:
     """
 
     logger = logging.getLogger(__name__).getChild("Windscribe")
+    _denied_statuses = frozenset({403, 504})
 
     def __init__(self, ua_file: str, vpn_file: str):
-        self.user_agents = self._get_line_generator(ua_file)
-        self.vpns = self._get_line_generator(vpn_file)
+        # files are read once up-front so that picking a line doesn't
+        # require any i/o
+        self.user_agents = self._cycle_lines(ua_file)
+        self.vpns = self._cycle_lines(vpn_file)
+        self.windscribe = shutil.which("windscribe")
+        if self.windscribe is None:
+            raise RuntimeError("Unable to find windscribe CLI on PATH")
         self.vpn_tag = uuid.uuid4()
         self.user_agent = next(self.user_agents)
 
@@ -66,81 +87,88 @@ class WindscribeMiddleware:
         return cls(ua_file, vpn_file)
 
     @staticmethod
-    def _get_line_generator(file_path):
-        """Return generator that yields random lines from given file."""
+    def _cycle_lines(file_path):
+        """Return iterator cycling over shuffled lines of given file."""
 
-        def get_rand_line():
-            with open(file_path, "r") as f_obj:
-                while True:
-                    f_obj.seek(0, 2)
-                    filesize = f_obj.tell()
+        with open(file_path, "r") as f_obj:
+            lines = [line for line in map(str.strip, f_obj) if line]
+        random.shuffle(lines)
+        return itertools.cycle(lines)
 
-                    random_line = random.randint(0, filesize)
-                    f_obj.seek(random_line)
-                    f_obj.readline()  # might be in middle of line
-                    result = f_obj.readline()
-                    if len(result) == 0:  # might have ended up at EOF
-                        f_obj.seek(0)
-                        result = f_obj.readline()
-                    yield result.strip()
+    def _windscribe_reconnect(self, retries=3, timeout=15, backoff=1):
+        """
+        Reconnect windscribe though the CLI.
 
-        return get_rand_line()
-
-    def _windscribe_reconnect(self, retries=3):
-        """Reconnect windscribe though the CLI."""
+        Failed attempts are retried up to ``retries`` times, waiting
+        ``backoff`` seconds before the first retry and doubling the
+        wait before each one after that.
+        """
 
         self.logger.debug(
             "Reconnecting to windscribe with %s retries", retries
         )
 
-        try:
-            vpn = next(self.vpns)
-            cmd = shlex.split(f"{shutil.which('windscribe')} connect '{vpn}'")
-            self.logger.debug(f"Executing {cmd}")
-            result = subprocess.run(cmd, capture_output=True, check=True)
-            # Expecting last two lines of output to be:
-            # connected to <location>
-            # your ip changed from <ip> to <ip>
-            res_stdout = result.stdout.decode("latin-1").strip()
-            if ("Connected to" not in res_stdout) and (
-                "Your IP changed from" not in res_stdout
-            ):
-                raise ValueError(f"Unexpected output {res_stdout}")
-            out = "{} ({})".format(*res_stdout.split("\n")[-2:])
-            self.logger.debug(
-                "Successfully reconnected to windscribe: %s", out
-            )
-            self.vpn_tag = uuid.uuid4()
+        error = None
+        for attempt in range(retries + 1):
+            if attempt != 0:
+                delay = backoff * 2 ** (attempt - 1)
+                self.logger.warning("Retrying in %s seconds...", delay)
+                time.sleep(delay)
+            try:
+                vpn = next(self.vpns)
+                cmd = [self.windscribe, "connect", vpn]
+                self.logger.debug(f"Executing {cmd}")
+                result = subprocess.run(
+                    cmd, capture_output=True, check=True, timeout=timeout
+                )
+                # Expecting last two lines of output to be:
+                # connected to <location>
+                # your ip changed from <ip> to <ip>
+                res_stdout = result.stdout.decode("latin-1").strip()
+                if ("Connected to" not in res_stdout) and (
+                    "Your IP changed from" not in res_stdout
+                ):
+                    raise ValueError(f"Unexpected output {res_stdout}")
+                out = "{} ({})".format(*res_stdout.split("\n")[-2:])
+                self.logger.debug(
+                    "Successfully reconnected to windscribe: %s", out
+                )
+                self.vpn_tag = uuid.uuid4()
+                return
+            except (
+                subprocess.CalledProcessError,
+                subprocess.TimeoutExpired,
+                ValueError,
+            ) as exception:
+                self.logger.warning(
+                    "Unable to reconnect to windscribe: %s", exception
+                )
+                error = exception
 
-        except (subprocess.CalledProcessError, ValueError) as exception:
-            self.logger.warning(
-                "Unable to reconnect to windscribe: %s", exception
-            )
-            if retries != 0:
-                self.logger.warning("Retrying...")
-                self._windscribe_reconnect(retries=retries - 1)
-            else:
-                raise RuntimeError(
-                    f"Unable to reconnect to windscribe: {exception}"
-                ) from exception
+        raise RuntimeError(
+            f"Unable to reconnect to windscribe: {error}"
+        ) from error
+
+    @staticmethod
+    def _is_denied_page(body: bytes) -> bool:
+        """Return if the page title of the given body is access denied."""
+
+        match = _TITLE_RE.search(body, 0, _HEAD_SCAN_BYTES)
+        return match is not None and match.group(1) == _DENIED_TITLE
 
     # pylint: disable=unused-argument
     def process_request(self, request, spider):
         """Set user agent header and meta for current vpn."""
-        request.headers.setdefault(b"User-Agent", self.user_agent)
-        request.headers[b"User-Agent"] = self.user_agent
-        request.meta["vpn-tag"] = self.vpn_tag
+        request.headers[_UA_HEADER] = self.user_agent
+        request.meta[_VPN_TAG] = self.vpn_tag
 
     # pylint: disable=unused-argument
     def process_response(self, request, response, spider):
         """On access denied, try to reconnect to windscribe."""
 
-        if (
-            response.css("title::text").get() == "Access Denied"
-            or response.status == 504
-            or response.status == 403
-        ):
-            if request.meta["vpn-tag"] == self.vpn_tag:
+        denied = response.status in self._denied_statuses
+        if denied or self._is_denied_page(response.body):
+            if request.meta[_VPN_TAG] == self.vpn_tag:
                 self.logger.info("Got Access Denied for %s", request.url)
                 self._windscribe_reconnect()
                 self.user_agent = next(self.user_agents)
@@ -148,14 +176,12 @@ class WindscribeMiddleware:
                     "Setting user-agent to '%s'", self.user_agent
                 )
 
-                request.headers.setdefault(b"User-Agent", self.user_agent)
-
             self.logger.info(
                 "Retrying access denied with updated vpn for '%s'", request.url
             )
-            request.headers[b"User-Agent"] = self.user_agent
+            request.headers[_UA_HEADER] = self.user_agent
             new_req = request.copy()
-            new_req.meta["vpn-tag"] = self.vpn_tag
+            new_req.meta[_VPN_TAG] = self.vpn_tag
             return new_req
 
         return response
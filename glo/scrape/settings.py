@@ -84,7 +84,7 @@ AUTOTHROTTLE_TARGET_CONCURRENCY = 3.0
 
 RETRY_ENABLED = True
 RETRY_TIMES = 4  # initial response + 4 retries = 5 requests
-RETRY_HTTP_CODES = [500, 502, 503, 504, 522, 524, 408, 429, 403]
+RETRY_HTTP_CODES = frozenset({500, 502, 503, 504, 522, 524, 408, 429, 403})
 
 # Enable and configure HTTP caching (disabled by default)
 HTTPCACHE_ENABLED = True
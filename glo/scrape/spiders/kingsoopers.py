@@ -3,12 +3,48 @@
 """
 Scrapy Spider for pulling products off of King Sooper's website.
 """
+import mmap
 import os
+import re
+from lxml import etree
+from parsel.csstranslator import css2xpath
 from scrapy.spiders import Spider
 from scrapy.http import Request
 from ..items import KingSooperProductLoader, KingSooperProduct
 
 
+# matches the url within a sitemap's <loc> tags
+_LOC_RE = re.compile(rb"<loc>\s*(https[^<\s]*)\s*</loc>")
+
+# product page queries, translated from css to xpath once rather than
+# on every response
+_XPATHS = {
+    "title": css2xpath("title::text"),
+    "heading": css2xpath(".kds-Heading--xl::text"),
+    "url": css2xpath('link[rel="canonical"]::attr(href)'),
+    "name": css2xpath(".ProductDetails-header::text"),
+    "upc": css2xpath(".ProductDetails-upc::text"),
+    "weight": css2xpath(".ProductDetails-sellBy::text"),
+    "allergens": css2xpath(".NutritionIngredients-Allergens::text"),
+    "indicators": css2xpath(".NutritionIndicators") + "/div/@title",
+    "serving": css2xpath(".NutritionLabel-ServingSize") + "/span[2]/text()",
+}
+
+# the price and nutrition dicts are built by zipping two node lists,
+# so those queries are compiled and evaluated directly against the
+# parsed document
+_PRICE_LABELS = etree.XPath(css2xpath("label::attr(for)"), smart_strings=False)
+_PRICE_VALUES = etree.XPath(
+    css2xpath(".kds-Price::attr(value)"), smart_strings=False
+)
+_NUTRIENT_TITLES = etree.XPath(
+    css2xpath(".NutrientDetail-Title::text"), smart_strings=False
+)
+_NUTRIENT_AMOUNTS = etree.XPath(
+    css2xpath(".NutrientDetail-TitleAndAmount::text"), smart_strings=False
+)
+
+
 class KingSooperSpider(Spider):
     """
     Scape King Sooper's website using their sitemaps.
@@ -46,59 +82,35 @@ class KingSooperSpider(Spider):
         sitemap_file = getattr(self, "kssm", None)  # set from cli
         if sitemap_file is None:
             raise ValueError("Need kssm argument to be set to sitemap file.")
-        with open(os.path.abspath(sitemap_file), "r") as smfile:
-            while True:
-                # strip whitespace and then loc tags
-                line = (
-                    smfile.readline().strip().lstrip("<loc>").rstrip("</loc>")
-                )
-                if line.startswith("https"):
-                    yield Request(line, self.parse)
-                elif not line:
-                    break
+        with open(os.path.abspath(sitemap_file), "rb") as smfile, mmap.mmap(
+            smfile.fileno(), 0, access=mmap.ACCESS_READ
+        ) as smmap:
+            for match in _LOC_RE.finditer(smmap):
+                yield Request(match.group(1).decode(), self.parse)
 
     @staticmethod
     def __parse_response(response):
         loader = KingSooperProductLoader(
             item=KingSooperProduct(), response=response
         )
-        loader.add_css("url", 'link[rel="canonical"]::attr(href)')
-        loader.add_css("name", ".ProductDetails-header::text")
-        loader.add_css("upc", ".ProductDetails-upc::text")
-        loader.add_css("weight", ".ProductDetails-sellBy::text")
+        root = response.selector.root
+        for field in ("url", "name", "upc", "weight", "allergens"):
+            loader.add_xpath(field, _XPATHS[field])
         loader.add_value(
             "price",
-            dict(
-                zip(
-                    response.css("label::attr(for)").getall(),
-                    response.css(".kds-Price::attr(value)").getall(),
-                )
-            ),
+            dict(zip(_PRICE_LABELS(root), _PRICE_VALUES(root))),
         )
-        loader.add_css("allergens", ".NutritionIngredients-Allergens::text")
         loader.add_value(
-            "indicators",
-            response.css(".NutritionIndicators")
-            .xpath("./div/@title")
-            .getall(),
+            "indicators", response.xpath(_XPATHS["indicators"]).getall()
         )
         loader.add_value(
             "serving",
             # returns ['serving size', '<serving size val']
-            response.css(".NutritionLabel-ServingSize")
-            .xpath("./span[2]/text()")
-            .getall(),
+            response.xpath(_XPATHS["serving"]).getall(),
         )
         loader.add_value(
             "nutrition",
-            dict(
-                zip(
-                    response.css(".NutrientDetail-Title::text").getall(),
-                    response.css(
-                        ".NutrientDetail-TitleAndAmount::text"
-                    ).getall(),
-                )
-            ),
+            dict(zip(_NUTRIENT_TITLES(root), _NUTRIENT_AMOUNTS(root))),
         )
 
         item = loader.load_item()
@@ -108,17 +120,26 @@ class KingSooperSpider(Spider):
     def parse(self, response, **kwargs):
         """Parse product page into a ``KingSooperProduct``."""
 
-        if response.css("title::text").get() == "Access Denied":
+        # check the raw body for each marker first, so that selectors
+        # only run when there is something for them to find
+        body = response.body
+        if (
+            b"Access Denied" in body
+            and response.xpath(_XPATHS["title"]).get() == "Access Denied"
+        ):
             raise ConnectionRefusedError("Access Denied")
-        una = response.css(".kds-Heading--xl::text").get()
-        nut = response.css(".NutrientDetail-TitleAndAmount::text").getall()
+        una = None
+        if b"kds-Heading--xl" in body:
+            una = response.xpath(_XPATHS["heading"]).get()
         # use request url to ensure we get the right one
         # sometimes splash returns things out of order
         url = response.request.url
-        if una is None or (una is not None and "unavailable" in una):
+        if una is None or "unavailable" in una:
             self.logger.debug(f"Skipping url (unavailable): {url}")
             yield None
-        elif nut is None or (nut is not None and len(nut) == 0):
+        elif b"NutrientDetail-TitleAndAmount" not in body or not (
+            _NUTRIENT_AMOUNTS(response.selector.root)
+        ):
             self.logger.debug(f"Skipping url (no nutrition info): {url}")
             yield None
         else:
@@ -32,6 +32,18 @@ class BaseTransform(FunctionTransformer):
     def fit(self, sample):  # pylint: disable=unused-argument
         return self
 
+    def transform(self, X):  # pylint: disable=invalid-name
+        # glo's transforms take arbitrary samples, so unless validation
+        # was asked for, skip sklearn's input checks and call func as-is
+        if self.validate:
+            return super().transform(X)
+        return self.func(X, **(self.kw_args or dict()))
+
+    def inverse_transform(self, X):  # pylint: disable=invalid-name
+        if self.validate:
+            return super().inverse_transform(X)
+        return self.inverse_func(X, **(self.inv_kw_args or dict()))
+
     def _inverse(self, sample):  # pylint: disable=no-self-use
         return sample
 
@@ -130,9 +142,9 @@ class TransformCompose(BaseTransform):
         self.transforms = transforms
 
     def __call__(self, sample):
-        return functools.reduce(
-            lambda output, t_func: t_func(output), self.transforms, sample
-        )
+        for t_func in self.transforms:
+            sample = t_func(sample)
+        return sample
 
 
 def filter_nan_wrap(
@@ -162,10 +174,12 @@ def filter_nan_wrap(
         Otherwise, call the wrapped function.
     """
 
+    @functools.wraps(func)
     def wrapped(
         self: BaseTransform, sample: Union[pd.Series, float]
     ) -> Union[pd.Series, float]:
-        if sample.isna().values.all(axis=0):
+        # checking the backing array skips building a boolean Series
+        if pd.isna(sample.to_numpy()).all():
             return sample
         return func(self, sample)
 
@@ -218,3 +232,54 @@ class PandasFindMissing(PandasBaseTransform):
                 return np.nan
 
         return series
+
+    def transform_dataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Set each row of the given dataframe to ``np.nan`` if invalid.
+
+        Gives the same rows as applying ``transform_series`` to each
+        row, but checks the expected columns one at a time rather
+        than building a Series for every row. Rows that are already
+        entirely ``np.nan`` are left as-is.
+
+        Parameters
+        ----------
+        dataframe: pd.DataFrame
+            Pandas DataFrame to transform.
+        """
+
+        result = dataframe.copy()
+        # rows that are already invalid, or entirely nan, aren't checked
+        # any further, just like in transform_series
+        done = result.isna().all(axis=1).to_numpy()
+        invalid = np.zeros(len(result), dtype=bool)
+        for key, value in self.expected_columns.items():
+            pending = np.flatnonzero(~done)
+            if len(pending) == 0:
+                break
+
+            if key in result.columns:
+                # as objects, typed columns give python scalars rather
+                # than numpy ones, which the isinstance check expects
+                samp_vals = result[key].astype(object).to_numpy()[pending]
+                failed = pending[
+                    [
+                        samp_val is None
+                        or (self.fill_nan and samp_val is np.nan)
+                        or not isinstance(samp_val, value)
+                        for samp_val in samp_vals
+                    ]
+                ]
+            else:
+                failed = pending
+
+            count = len(failed)
+            if count:
+                self.missing_count[key] = (
+                    self.missing_count.get(key, 0) + count
+                )
+            invalid[failed] = True
+            done[failed] = True
+
+        result.loc[invalid, :] = np.nan
+        return result
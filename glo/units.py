@@ -2,14 +2,77 @@
 # -*- coding: utf-8 -*-
 """Initialize unit registry from ``pint`` module."""
 from abc import ABC, abstractmethod
-from typing import Set
+from typing import Any, Callable, FrozenSet, Pattern, Set, Tuple, Union
+import functools
 import re
 import pint
 from glo.helpers import prep_ascii_str
 
 ureg = pint.UnitRegistry(system="SI")
 Q_ = ureg.Quantity
-Q_class = Q_("1337 seconds").__class__
+Q_class = ureg.Quantity
+
+
+@functools.lru_cache(maxsize=8192)
+def _find_unit_strs(pattern: Pattern, s_in: str) -> FrozenSet[str]:
+    """Cached body of ``ASCIIUnitParser.find_unit_strs``."""
+
+    s_in = prep_ascii_str(s_in)
+    return frozenset(m.strip() for m in pattern.findall(s_in))
+
+
+@functools.lru_cache(maxsize=8192)
+def _find_spaced_unit_strs(pattern: Pattern, s_in: str) -> FrozenSet[str]:
+    """Cached body of ``UnitWithSpaceParser.find_unit_strs``."""
+
+    matches = set()
+    for number, words in pattern.findall(prep_ascii_str(s_in)):
+        words = words.rstrip()
+        matches.add((number + words).rstrip())
+        if " " in words:
+            matches.add(number + words.replace(" ", "_"))
+    return frozenset(matches)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_quantity(u_str: str) -> Tuple[Any, pint.Unit]:
+    """Cached magnitude and units parsed from ``u_str`` by pint."""
+
+    quantity = Q_(u_str)
+    return quantity.m, quantity.units
+
+
+def parse_quantity(u_str: str) -> Q_class:
+    """
+    Return a new pint Quantity parsed from the given string.
+
+    Same as ``Q_(u_str)``, except the parsed magnitude and units are
+    cached, so strings that show up over and over again, such as
+    serving sizes, are only ever parsed by pint once. Strings that
+    fail to parse aren't cached.
+
+    Parameters
+    ----------
+    u_str: str
+        String to turn into a pint quantity
+
+    Returns
+    -------
+    pint.Quantity
+
+    Raises
+    ------
+    pint.UndefinedUnitError, TypeError
+        Same as ``Q_`` when the string can't be parsed.
+
+    Examples
+    --------
+    >>> from glo.units import parse_quantity
+    >>> parse_quantity("15 ounces")
+    <Quantity(15, 'ounce')>
+    """
+
+    return Q_(*_parse_quantity(u_str))
 
 
 class BaseUnitParser(ABC):
@@ -57,8 +120,11 @@ class ASCIIUnitParser(BaseUnitParser):
         characters
     """
 
-    _r_digit = r"\d+\/{1}\d+|\d+\.{1}\d+|\d+"
+    # a single branch covering fractions, decimals and integers
+    _r_digit = r"\d+(?:[./]\d+)?"
     _r_unit = fr"(?:{_r_digit})[\ a-zA-Z]+"
+    # input is always ascii by the time it is searched, see prep_ascii_str
+    _pattern = re.compile(f"({_r_unit})", re.ASCII)
 
     def find_unit_strs(self, s_in: str) -> Set[str]:
         """
@@ -91,9 +157,12 @@ class ASCIIUnitParser(BaseUnitParser):
         ['1/3 jug', '15 gal']
         """
 
-        s_in = prep_ascii_str(s_in)
-        matches = re.findall(f"({self._r_unit})", s_in)
-        return {m.strip() for m in matches}
+        return set(_find_unit_strs(self._pattern, s_in))
+
+
+# Shared default parser, so callers that don't bring their own parser
+# all reuse the same instance.
+DEFAULT_PARSER = ASCIIUnitParser()
 
 
 class UnitWithSpaceParser(ASCIIUnitParser):
@@ -110,8 +179,11 @@ class UnitWithSpaceParser(ASCIIUnitParser):
     glo.features.serving.ASCIIUnitParser
     """
 
-    # add capture group on the words
-    _r_unit_word = fr"(?:{ASCIIUnitParser._r_digit})([\ a-zA-Z]+)"
+    # same matches as ASCIIUnitParser._pattern, but captures the number,
+    # with any following spaces, and the words separately
+    _pattern = re.compile(
+        fr"({ASCIIUnitParser._r_digit}\ *)([\ a-zA-Z]+)", re.ASCII
+    )
 
     def find_unit_strs(self, s_in: str) -> Set[str]:
         """
@@ -149,16 +221,24 @@ class UnitWithSpaceParser(ASCIIUnitParser):
         ['25 fluid ounces', '25 fluid_ounces']
         """
 
-        matches = set()
-        for match in super().find_unit_strs(s_in):
-            units = re.findall(self._r_unit_word, match)
-            matches.add(match)
-            for unit in units:
-                unit = unit.strip()
-                u_with_underscore = unit.strip().replace(" ", "_")
-                matches.add(match.replace(unit, u_with_underscore))
+        return set(_find_spaced_unit_strs(self._pattern, s_in))
+
+
+@functools.lru_cache(maxsize=512)
+def _div_factor(  # pylint: disable=invalid-name
+    u1: pint.Unit, u2: pint.Unit
+) -> Union[float, None]:
+    """
+    Return factor reducing ``u1 / u2`` to a dimensionless value.
+
+    Returns ``None`` if the units can't be simplified to a
+    dimensionless value.
+    """
 
-        return matches
+    result = (Q_(1, u1) / Q_(1, u2)).to_reduced_units()
+    if result.dimensionless:
+        return result.m
+    return None
 
 
 def simplified_div(  # pylint: disable=invalid-name
@@ -184,16 +264,138 @@ def simplified_div(  # pylint: disable=invalid-name
         dimensionless value
     """
 
-    result = (q1 / q2).to_reduced_units()
-    if result.dimensionless:
-        return float(result.m)
+    # the factor only depends on the units, so the unit simplification
+    # is only done once per pair of units
+    factor = _div_factor(q1.units, q2.units)
+    if factor is not None:
+        return float((q1.m / q2.m) * factor)
 
+    result = (q1 / q2).to_reduced_units()
     raise TypeError(
         f"Unable to simplify division of {q1} / {q2}. "
         f"Ended up with {result}."
     )
 
 
+# (from, to) unit pairs mapped to (factor, resulting units), or to None
+# for offset units such as temperatures, which can't be scaled
+_CONVERSION_FACTORS = dict()
+# (units, units, operator) mapped to the units of the product or
+# quotient, or to None if either side is an offset unit
+_PRODUCT_UNITS = dict()
+
+
+def _get_conversion(
+    from_units: pint.Unit, to_units: Union[pint.Unit, str]
+) -> Union[Tuple[float, pint.Unit], None]:
+    """
+    Return cached factor and resulting units for a unit conversion.
+
+    Returns ``None`` for offset units such as temperatures, which
+    can't be converted by scaling the magnitude alone.
+    """
+
+    key = (from_units, to_units)
+    try:
+        return _CONVERSION_FACTORS[key]
+    except KeyError:
+        pass
+
+    scaled = Q_(1, from_units).to(to_units)
+    # offset units are the ones whose zero isn't zero in base units
+    if (
+        Q_(0, from_units).to_base_units().m != 0
+        or Q_(0, scaled.units).to_base_units().m != 0
+    ):
+        conversion = None
+    else:
+        conversion = (scaled.m, scaled.units)
+    _CONVERSION_FACTORS[key] = conversion
+    return conversion
+
+
+def convert_quantity(
+    quantity: Q_class, units: Union[pint.Unit, str]
+) -> Q_class:
+    """
+    Return ``quantity.to(units)``, scaling by a cached factor if possible.
+
+    Examples
+    --------
+    >>> from glo.units import Q_, convert_quantity
+    >>> convert_quantity(Q_(250, "mg"), "g")
+    <Quantity(0.25, 'gram')>
+    >>> convert_quantity(Q_(10, "degC"), "kelvin")
+    <Quantity(283.15, 'kelvin')>
+    """
+
+    conversion = _get_conversion(quantity.units, units)
+    if conversion is None:
+        return quantity.to(units)
+    factor, to_units = conversion
+    return Q_(quantity.m * factor, to_units)
+
+
+def combine_quantities(
+    q1: Q_class, q2: Q_class, op: Callable[[Any, Any], Any]
+) -> Q_class:
+    """
+    Return ``op(q1, q2)`` for ``operator.add`` or ``operator.sub``.
+
+    Gives the same result as pint, converting ``q2`` into the units of
+    ``q1`` with a cached factor rather than through the registry.
+    """
+
+    conversion = _get_conversion(q2.units, q1.units)
+    if conversion is None:
+        return op(q1, q2)
+    return Q_(op(q1.m, q2.m * conversion[0]), q1.units)
+
+
+def _get_product_units(
+    units1: pint.Unit, units2: pint.Unit, op: Callable[[Any, Any], Any]
+) -> Union[pint.Unit, None]:
+    """
+    Return cached units of ``op(q1, q2)`` for multiplication or division.
+
+    Returns ``None`` for offset units, which pint refuses to multiply
+    or divide.
+    """
+
+    key = (units1, units2, op)
+    try:
+        return _PRODUCT_UNITS[key]
+    except KeyError:
+        pass
+
+    if (
+        Q_(0, units1).to_base_units().m != 0
+        or Q_(0, units2).to_base_units().m != 0
+    ):
+        units = None
+    else:
+        units = op(Q_(1, units1), Q_(1, units2)).units
+    _PRODUCT_UNITS[key] = units
+    return units
+
+
+def scale_quantities(
+    q1: Q_class, q2: Q_class, op: Callable[[Any, Any], Any]
+) -> Q_class:
+    """
+    Return ``op(q1, q2)`` for ``operator.mul`` or ``operator.truediv``.
+
+    Gives the same result as pint, operating on the magnitudes and
+    looking up the resulting units in a cache rather than merging
+    the units of both quantities on every call.
+    """
+
+    units = _get_product_units(q1.units, q2.units, op)
+    if units is None:
+        return op(q1, q2)
+    return Q_(op(q1.m, q2.m), units)
+
+
 def get_quantity_from_str(s_in: str, parser: BaseUnitParser) -> Set[Q_class]:
     """
     Parse the given input string and return set of pint Quantities
@@ -220,7 +422,7 @@ def get_quantity_from_str(s_in: str, parser: BaseUnitParser) -> Set[Q_class]:
     results = set()
     for u_str in unit_strs:
         try:
-            results.add(Q_(u_str))
+            results.add(parse_quantity(u_str))
         except (pint.UndefinedUnitError, TypeError):
             pass
 
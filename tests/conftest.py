@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+from glo.features.allergen import ASCIIAllergenParser
+
+
+@pytest.fixture(scope="session")
+def aap():
+    """ASCIIAllergenParser shared by every test in the session."""
+
+    return ASCIIAllergenParser()
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import operator
+from math import isclose
 import pytest
 import numpy as np
 from glo.units import Q_, ureg
@@ -70,20 +72,19 @@ def test_operator_overloads_nutrition_fact():
     with pytest.raises(TypeError):
         nf1 - 15
 
-    _locals = {"nf1": nf1, "nf3": nf3}
-    for op in ("+", "-", "*", "/"):
+    for op in (operator.add, operator.sub, operator.mul, operator.truediv):
         # Doesn't make sense to do these operations with strings
         with pytest.raises(TypeError):
-            eval(f'nf1 {op} "I am a string"', _locals)
+            op(nf1, "I am a string")
         with pytest.raises(ValueError):
             # Doesn't make sense to do operations with sodium and calories
-            eval(f"nf1 {op} nf3", _locals)
+            op(nf1, nf3)
 
-    assert round((nf1 + q).amount, ndigits=2) == 10.03
-    assert round((nf1 + nf2).amount, ndigits=1) == 21.2
+    assert isclose((nf1 + q).amount, 10.03, abs_tol=5e-3)
+    assert isclose((nf1 + nf2).amount, 21.2, abs_tol=5e-2)
 
-    assert round((nf1 - q).amount, ndigits=2) == 9.97
-    assert round((nf1 - nf2).amount, ndigits=1) == -1.2
+    assert isclose((nf1 - q).amount, 9.97, abs_tol=5e-3)
+    assert isclose((nf1 - nf2).amount, -1.2, abs_tol=5e-2)
 
     assert (nf1 * 2).amount == 20
     assert (nf1 * q).quantity == Q_(0.3, "grams ** 2")
@@ -94,6 +95,19 @@ def test_operator_overloads_nutrition_fact():
     assert (nf1 / nf2).quantity == Q_(10 / 11.2, "dimensionless")
 
 
+def test_nutrition_fact_accepts_str_subclass_names():
+    """Test ``NutritionFact`` and ``NutritionSet`` accept ``np.str_``."""
+
+    name = np.array(["sodium"])[0]
+    nf = NutritionFact(name, Q_(10, "grams"))
+    assert nf.name == "sodium"
+    assert type(nf.name) is str
+
+    ns = NutritionSet()
+    ns[name] = Q_(10, "grams")
+    assert ns["sodium"] == nf
+
+
 def test_nutrition_fact_name_is_read_only():
     """Test that ``NutritionFact.name`` is read-only."""
 
@@ -138,6 +152,49 @@ def test_create_basic_nutrition_set_instance():
     assert ns.get("not here").amount == 0
 
 
+def test_nutrition_set_setdefault():
+    """Test ``NutritionSet.setdefault`` only stores given defaults."""
+
+    ns = NutritionSet(NutritionFact("sodium", Q_(10, "grams")))
+    assert ns.setdefault("sodium").amount == 10
+    assert ns.setdefault("sodium", Q_(5, "grams")).amount == 10
+
+    assert ns.setdefault("fat").amount == 0
+    assert "fat" not in ns
+
+    assert ns.setdefault("fat", Q_(11, "grams")).amount == 11
+    assert ns["fat"].quantity == Q_(11, "grams")
+
+
+def test_nutrition_set_from_records_accepts_arrays():
+    """Test ``NutritionSet.from_records`` with numpy array columns."""
+
+    names = np.array(["sodium", "fat", "protein"])
+    magnitudes = np.array([10, 11, 12])
+
+    ns = NutritionSet.from_records(names, magnitudes, np.str_("grams"))
+    assert sorted(ns.keys()) == ["fat", "protein", "sodium"]
+    assert ns["fat"].quantity == Q_(11, "grams")
+
+    units = np.array(["mg", "g", "g"])
+    ns = NutritionSet.from_records(names, magnitudes, units)
+    assert ns["sodium"].quantity == Q_(10, "milligrams")
+    assert ns["protein"].quantity == Q_(12, "grams")
+
+
+def test_nutrition_set_copy():
+    """Test ``NutritionSet.copy`` returns a separate ``NutritionSet``."""
+
+    ns = NutritionSet(NutritionFact("sodium", Q_(10, "grams")))
+    ns_copy = ns.copy()
+    assert isinstance(ns_copy, NutritionSet)
+    assert ns_copy == ns
+
+    ns_copy["fat"] = Q_(1, "grams")
+    assert "fat" not in ns
+    assert (ns_copy + ns)["sodium"].amount == 20
+
+
 def test_can_edit_nutrition_set_instance():
     """Test can edit attributes of ``NutritionSet``."""
 
@@ -172,23 +229,23 @@ def test_update_method_nutrition_set():
 
     ns.update(nf1)
     assert ns["sodium"].amount == 10
-    ns.data = dict()
+    ns.clear()
 
     ns.update({"fat": nf2.quantity})
     assert ns["fat"].amount == 11
-    ns.data = dict()
+    ns.clear()
 
     ns.update([nf1, nf2, nf3])
     assert ns["sodium"].amount == 10
     assert ns["fat"].amount == 11
     assert ns["my metric"].amount == 100
-    ns.data = dict()
+    ns.clear()
 
     ns.update((_ for _ in [nf1, nf2, nf3]))  # check we can use iters
     assert ns["sodium"].amount == 10
     assert ns["fat"].amount == 11
     assert ns["my metric"].amount == 100
-    ns.data = dict()
+    ns.clear()
 
     ns.update(ns2)
     assert ns["protein"].amount == 15
@@ -222,9 +279,10 @@ def test_update_method_nutrition_set_raises_errors_on_bad_types():
         with pytest.raises(TypeError):
             ns.update(a)
 
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="Expected type str"):
         ns[10] = Q_(10, "grams")
-        test = ns[10]
+    with pytest.raises(TypeError, match="Expected type str"):
+        ns[10]
 
 
 def test_nutrition_fact_as_dict_and_from_dict_methods():
@@ -276,6 +334,39 @@ def test_can_add_and_subtract_nutrition_set_instances():
     }
 
 
+def test_sum_bulk_matches_adding_nutrition_set_instances():
+    """Test that ``sum_bulk`` gives the same result as chaining ``+``."""
+
+    ns_dicts = [
+        {
+            "sodium": Q_(10, "milligrams"),
+            "fat": Q_(15, "grams"),
+            "sugar": Q_(0, "grams"),
+        },
+        {
+            "sodium": Q_(5, "grams"),
+            "fat": Q_(0, "grams"),
+            "trans fat": Q_(8, "grams"),
+        },
+        {
+            "sodium": Q_(20, "milligrams"),
+            "fat": Q_(250, "milligrams"),
+            "fiber": Q_(0, "grams"),
+        },
+    ]
+    nut_sets = [NutritionSet.from_dict(ns_dict) for ns_dict in ns_dicts]
+
+    expected = nut_sets[0]
+    for nut_set in nut_sets[1:]:
+        expected = expected + nut_set
+
+    result = NutritionSet.sum_bulk(nut_sets)
+    assert result == expected
+    assert result["sodium"].quantity == Q_(5030, "milligrams")
+    assert result["sugar"].quantity == Q_(0, "grams")
+    assert NutritionSet.sum_bulk([]) == NutritionSet()
+
+
 def test_can_determine_if_two_nutrition_set_instances_are_equal():
     """Test thah we can determine if two NutritionSets are equal."""
 
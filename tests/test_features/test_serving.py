@@ -2,21 +2,41 @@
 # -*- coding: utf-8 -*-
 import pytest
 from typing import Set
+import numpy as np
+import pandas as pd
 from glo.units import BaseUnitParser
-from glo.features.serving import get_num_servings
+from glo.features.serving import (
+    get_num_servings,
+    PandasParseServing,
+    _get_default_num_servings,
+)
 
 
-def test_get_num_servings_basic_usage():
-    """Test basic usage of get_num_servings."""
-
-    tests = [
+@pytest.mark.parametrize(
+    "weight,ss,result",
+    [
         ["15 ounces", "5 ounces", 3],
         ["5 seconds", "2 seconds", 5.0 / 2],
         ["1.5 ounces", "9/2 ounces", 1.5 / (9 / 2.0)],
-    ]
+    ],
+)
+def test_get_num_servings_basic_usage(weight, ss, result):
+    """Test basic usage of get_num_servings."""
+
+    assert get_num_servings(weight, ss) == result
 
-    for weight, ss, result in tests:
-        assert get_num_servings(weight, ss) == result
+
+def test_get_num_servings_caches_default_arguments():
+    """Test get_num_servings only memoizes calls with default arguments."""
+
+    _get_default_num_servings.cache_clear()
+    assert get_num_servings("15 ounces", "5 ounces") == 3
+    assert get_num_servings("15 ounces", "5 ounces") == 3
+    assert _get_default_num_servings.cache_info().hits == 1
+
+    div_func = PandasParseServing.div_func
+    assert get_num_servings("15 ounces", "5 ounces", div_func=div_func) == 3
+    assert _get_default_num_servings.cache_info().currsize == 1
 
 
 def test_get_num_servings_unit_search():
@@ -55,3 +75,24 @@ def test_get_num_servings_custom_div_function():
         return 1.0
 
     assert get_num_servings("8 seconds", "4 seconds", div_func=my_div_function)
+
+
+def test_pandas_parse_serving_dataframe_matches_series():
+    """Test PandasParseServing gives the same servings for rows and frames."""
+
+    frame = pd.DataFrame(
+        {
+            "weight": ["15 ounces", "15 ounces", "8 floz", np.nan, "nope"],
+            "serving": ["5 ounces", "5 ounces", "(1 cup)", np.nan, "nope"],
+        }
+    ).astype(object)
+    transform = PandasParseServing()
+
+    with pytest.warns(RuntimeWarning):
+        result = transform(frame)
+
+    assert list(result.columns) == ["weight", "serving", "servings"]
+    assert list(result["servings"][:3]) == [3.0, 3.0, 1.0]
+    assert result.iloc[3:].isna().all(axis=None)
+    for idx in range(3):
+        assert transform(frame.iloc[idx]).equals(result.iloc[idx])
@@ -35,6 +35,44 @@ def test_MultiMethod_type_errors():
     assert mm(36.5, 45.6) == test2(36.5, 45.6)
 
 
+def test_MultiMethod_single_argument():
+    """Assert MultiMethod dispatches single-argument signatures."""
+
+    mm = MultiMethod("test")
+    mm.register((int,), lambda a: a * 2)
+    mm.register((str,), lambda a: a.upper())
+    mm.register((int, int), lambda a, b: a + b)
+
+    assert mm(5) == 10
+    assert mm("abc") == "ABC"
+    assert mm(5, 6) == 11
+
+    with pytest.raises(TypeError):
+        mm(5.6)
+    with pytest.raises(TypeError):
+        mm((5,))
+
+
+def test_MultiMethod_subclass_arguments():
+    """Assert MultiMethod falls back to signatures of base classes."""
+
+    class MyInt(int):
+        pass
+
+    mm = MultiMethod("test")
+    mm.register((int, int), lambda a, b: a + b)
+
+    assert mm(MyInt(5), 6) == 11
+    assert mm(True, MyInt(1)) == 2
+    with pytest.raises(TypeError):
+        mm(MyInt(5), 6.5)
+
+    mm.register((int, float), lambda a, b: a * b)
+    assert mm(MyInt(5), 6.5) == 32.5
+    mm.register((MyInt, int), lambda a, b: a - b)
+    assert mm(MyInt(5), 6) == -1
+
+
 def test_prep_ascii_str():
     """Assert prep_ascii_str properly prepares string."""
 
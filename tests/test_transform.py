@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+from glo.transform import BaseTransform, PandasFindMissing
+
+
+def test_pandas_find_missing_dataframe_matches_series():
+    """Test PandasFindMissing gives the same rows for frames and series."""
+
+    frame = pd.DataFrame(
+        {
+            "a": [1, "x", np.nan, 3, np.nan, None],
+            "b": ["s", "t", "u", 5, np.nan, "v"],
+            "c": [1, 2, 3, 4, np.nan, 6],
+        }
+    ).astype(object)
+    expected_columns = {"a": int, "b": str}
+
+    by_frame = PandasFindMissing(expected_columns)
+    result = by_frame(frame)
+    by_series = PandasFindMissing(expected_columns)
+    for i, row in frame.iterrows():
+        expected = by_series(row)
+        if isinstance(expected, float) or expected.isna().all():
+            assert result.loc[i].isna().all()
+        else:
+            assert result.loc[i].equals(expected)
+
+    assert by_frame.missing_count == {"a": 3, "b": 1}
+    assert by_series.missing_count == by_frame.missing_count
+
+
+def test_pandas_find_missing_missing_column():
+    """Test PandasFindMissing invalidates rows missing a column."""
+
+    frame = pd.DataFrame({"a": [1, 2]}).astype(object)
+    transform = PandasFindMissing({"a": int, "b": str})
+
+    assert transform(frame).isna().all(axis=None)
+    assert transform.missing_count == {"b": 2}
+
+
+def test_pandas_find_missing_typed_columns():
+    """Test PandasFindMissing checks python types of typed columns."""
+
+    frame = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]})
+    transform = PandasFindMissing({"a": int, "b": str})
+    result = transform(frame)
+
+    assert result["a"].tolist()[::2] == [1, 3]
+    assert result["b"].tolist()[::2] == ["x", "z"]
+    assert result.loc[1].isna().all()
+    assert transform.missing_count == {"b": 1}
+
+
+def test_base_transform_transform_calls_transform():
+    """Test BaseTransform.transform and inverse_transform call through."""
+
+    class AddFive(BaseTransform):
+        def __call__(self, sample):
+            return sample + 5
+
+        def _inverse(self, sample):
+            return sample - 5
+
+    transform = AddFive()
+    assert transform.transform(5) == 10
+    assert transform.inverse_transform(10) == 5
+    assert transform.fit_transform(5) == 10
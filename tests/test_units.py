@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import pytest
+import pint
 from glo.units import (
     ureg,
     Q_,
@@ -9,6 +10,7 @@ from glo.units import (
     ASCIIUnitParser,
     UnitWithSpaceParser,
     get_quantity_from_str,
+    parse_quantity,
 )
 
 
@@ -20,23 +22,35 @@ def test_Q_class_passes_is_instance_call():
     assert my_quantity.__class__ == Q_class
 
 
-def test_simplified_div_works_as_expected():
-    """Test we can use simplified_div to divide quantities."""
-
-    tests = (
+@pytest.mark.parametrize(
+    "s1,s2,expected",
+    [
         ("10 seconds", "5 seconds", 2),
         ("15 seconds ** 2", "5 seconds", None),
         ("40 ounces", "8 ounces", 5),
         ("45 ounces", "8 floz", None),
-    )
+    ],
+)
+def test_simplified_div_works_as_expected(s1, s2, expected):
+    """Test we can use simplified_div to divide quantities."""
+
+    q1, q2 = parse_quantity(s1), parse_quantity(s2)
+    if expected is None:
+        with pytest.raises(TypeError):
+            simplified_div(q1, q2)
+    else:
+        assert simplified_div(q1, q2) == expected
+
 
-    for q1, q2, result in tests:
-        q1, q2 = Q_(q1), Q_(q2)
-        if result is None:
-            with pytest.raises(TypeError):
-                simplified_div(q1, q2)
-        else:
-            assert simplified_div(q1, q2) == result
+def test_parse_quantity_returns_new_quantities():
+    """Assert parse_quantity doesn't share cached quantities."""
+
+    q1, q2 = parse_quantity("10 grams"), parse_quantity("10 grams")
+    assert q1 == q2 == Q_("10 grams")
+    assert q1 is not q2
+
+    with pytest.raises(pint.UndefinedUnitError):
+        parse_quantity("10 not_a_unit")
 
 
 def test_create_ascii_unit_parser():
@@ -51,24 +65,24 @@ def test_create_unit_with_space_unit_parser():
     UnitWithSpaceParser()
 
 
-def test_find_unit_strs_ascii_unit_parser():
+@pytest.mark.parametrize(
+    "s_in,expected",
+    [
+        ("1.25cup (40 g)", {"1.25cup", "40 g"}),
+        ("0.667cup cereal (30 g)", {"0.667cup cereal", "30 g"}),
+        ("34biscuits (61 g)", {"34biscuits", "61 g"}),
+        ("3/4biscuits (6/1 g)", {"3/4biscuits", "6/1 g"}),
+        ("12 cans / 12 fl oz", {"12 cans", "12 fl oz"}),
+        ("1/2 cans / 1/2 fl oz", {"1/2 cans", "1/2 fl oz"}),
+        ("1.2 cans / 1.2 fl oz", {"1.2 cans", "1.2 fl oz"}),
+        ("  GO AWAY 🦠 ", set()),
+        ("  GO AWAY 🦠 1.2 ✅cans / ✅1.2 fl oz", {"1.2 cans", "1.2 fl oz"}),
+    ],
+)
+def test_find_unit_strs_ascii_unit_parser(s_in, expected):
     """Assert find_unit_strs properly finds unit strings."""
 
-    test_strs = {
-        "1.25cup (40 g)": {"1.25cup", "40 g"},
-        "0.667cup cereal (30 g)": {"0.667cup cereal", "30 g"},
-        "34biscuits (61 g)": {"34biscuits", "61 g"},
-        "3/4biscuits (6/1 g)": {"3/4biscuits", "6/1 g"},
-        "12 cans / 12 fl oz": {"12 cans", "12 fl oz"},
-        "1/2 cans / 1/2 fl oz": {"1/2 cans", "1/2 fl oz"},
-        "1.2 cans / 1.2 fl oz": {"1.2 cans", "1.2 fl oz"},
-        "  GO AWAY 🦠 ": set(),
-        "  GO AWAY 🦠 1.2 ✅cans / ✅1.2 fl oz": {"1.2 cans", "1.2 fl oz"},
-    }
-
-    aup = ASCIIUnitParser()
-    for p, a in test_strs.items():
-        assert aup.find_unit_strs(p) == a
+    assert ASCIIUnitParser().find_unit_strs(s_in) == expected
 
 
 def test_find_unit_strs_with_space_unit_parser():
@@ -99,12 +113,17 @@ def test_find_unit_strs_with_space_unit_parser():
         assert aup.find_unit_strs(p) == a
 
 
-def test_get_quantity_from_str_works_as_expected():
-    """Assert basic usage of get_quantity_from_str works"""
+@pytest.fixture(scope="module")
+def count_units():
+    """Define count units used by the king soopers labels, once."""
 
-    # make sure these are defined
     ureg.define("count = [] = ct = biscuits = can = cup_cereal")
 
+
+@pytest.mark.usefixtures("count_units")
+def test_get_quantity_from_str_works_as_expected():
+    """Assert basic usage of get_quantity_from_str works"""
+
     test_strs = {
         "1.25cup (40 g)": {"1.25cup", "40 g"},
         "0.667cup cereal (30 g)": {"30 g", "0.667 ct"},